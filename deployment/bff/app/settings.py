@@ -10,6 +10,10 @@ DEFAULT_WORKERS = 1
 DEFAULT_PORT = 8080
 DEFAULT_BACKLOG = 2048
 
+# search result cache
+DEFAULT_SEARCH_CACHE_SIZE = 1024
+DEFAULT_SEARCH_CACHE_TTL = 60  # seconds
+
 # debug flag
 DEFAULT_DEBUG = True
 
@@ -37,6 +37,28 @@ class SearchRequestModel(BaseRequestModel):
     )
 
 
+# all queries of a batch are sent to the flow in a single request
+MAX_BATCH_SEARCH_QUERIES = 100
+
+
+class BatchSearchRequestModel(BaseRequestModel):
+    limit: int = Field(
+        default=10, description='Number of matching results to return per query'
+    )
+    filters: Optional[Dict[str, str]] = Field(
+        default={},
+        description='dictionary with filters for search results  {"tag_name" : "tag_value"}. '
+        'The filters are applied to all queries of the batch.',
+    )
+    queries: List[Dict[str, ModalityModel]] = Field(
+        default=[],
+        max_items=MAX_BATCH_SEARCH_QUERIES,
+        description='List of queries. Each query is a dictionary which maps the field name to its value. '
+        'Currently only supports one field per query. Use as key query_text, query_image, or query_video, '
+        f'for a query with text, image, or video. At most {MAX_BATCH_SEARCH_QUERIES} queries are allowed.',
+    )
+
+
 class SearchResponseModel(BaseModel):
     id: str = Field(
         default=..., nullable=False, description='Id of the matching result.'
@@ -62,4 +84,5 @@ class SuggestionRequestModel(BaseRequestModel):
 
 IndexRequestModel.update_forward_refs()
 SearchRequestModel.update_forward_refs()
+BatchSearchRequestModel.update_forward_refs()
 SearchResponseModel.update_forward_refs()
@@ -7,6 +7,7 @@ from deployment.bff.app.v1.models.admin import (
 )
 from deployment.bff.app.v1.models.helper import BaseRequestModel
 from deployment.bff.app.v1.routers.helper import jina_client_post
+from deployment.bff.app.v1.routers.search import clear_search_cache
 
 router = APIRouter()
 
@@ -25,6 +26,8 @@ def update_user_email(data: UpdateEmailsRequestModel):
         endpoint='/admin/updateUserEmails',
         parameters={'user_emails': data.user_emails},
     )
+    # cached results must not be served to callers which lost their access
+    clear_search_cache(data.host, data.port)
 
 
 @router.post(
@@ -41,6 +44,8 @@ def update_api_keys(data: UpdateApiKeysRequestModel):
         endpoint='/admin/updateApiKeys',
         parameters={'api_keys': data.api_keys},
     )
+    # cached results must not be served to callers which lost their access
+    clear_search_cache(data.host, data.port)
 
 
 @router.post(
@@ -1,11 +1,20 @@
 import base64
-from typing import List
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 
+import msgpack
 from docarray import Document, DocumentArray, dataclass, field
 from docarray.typing import Image, Text, Video
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
+import deployment.bff.app.settings as api_settings
 from deployment.bff.app.v1.models.search import (
+    BatchSearchRequestModel,
     IndexRequestModel,
     SearchRequestModel,
     SearchResponseModel,
@@ -17,9 +26,177 @@ from deployment.bff.app.v1.routers.helper import (
     jina_client_post,
 )
 from now.data_loading.create_dataclass import create_dataclass
+from now.now_dataclasses import UserInput
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+DATA_CLASS_CACHE_SIZE = 32
+# maps the schema of the user input to the data class and the files to dataclass fields mapping
+_data_class_cache: Dict[str, Tuple[type, Dict]] = {}
+_data_class_cache_lock = threading.Lock()
+
+# maps the search key to the time of the flow call and the matches
+_search_cache: 'OrderedDict[tuple, Tuple[float, DocumentArray]]' = OrderedDict()
+# the routes run in a thread pool, so the cache is only accessed with its lock held
+_search_cache_lock = threading.Lock()
+
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+
+
+# temporary class until actual mm docs are created
+@dataclass
+class MMQueryDoc:
+    query_text: Text = field(default=None)
+    query_image: Image = field(default=None)
+    query_video: Video = field(default=None)
+
+
+def _get_data_class(user_input: UserInput) -> type:
+    """
+    Creates the data class for the user input and sets its `files_to_dataclass_fields`, just like `create_dataclass`.
+    The data class only depends on the schema of the user input, so it is only created once per schema.
+    """
+    key = repr(
+        (
+            user_input.search_fields,
+            user_input.filter_fields,
+            user_input.search_fields_modalities,
+            user_input.filter_fields_modalities,
+            user_input.dataset_type,
+        )
+    )
+    # the routes run in a thread pool, so the cache is only accessed with its lock held
+    with _data_class_cache_lock:
+        if key not in _data_class_cache:
+            if len(_data_class_cache) >= DATA_CLASS_CACHE_SIZE:
+                _data_class_cache.pop(next(iter(_data_class_cache)))
+            data_class = create_dataclass(user_input)
+            _data_class_cache[key] = (data_class, user_input.files_to_dataclass_fields)
+        data_class, user_input.files_to_dataclass_fields = _data_class_cache[key]
+    return data_class
+
+
+def _get_query_filter(filters: dict) -> dict:
+    return {key: {'$eq': value} for key, value in filters.items()}
+
+
+def _get_query_key(query: dict) -> tuple:
+    """
+    Builds a hashable key which identifies the content of a query. Blobs are represented by their hash, such that
+    large images don't have to be kept in memory.
+    """
+    query_key = []
+    for field_name, field_value in sorted(query.items()):
+        if field_value.blob:
+            value = (
+                'blob',
+                hashlib.blake2b(
+                    field_value.blob.encode('utf-8'), digest_size=16
+                ).digest(),
+            )
+        elif field_value.uri:
+            value = ('uri', field_value.uri)
+        else:
+            value = ('text', field_value.text)
+        query_key.append((field_name, value))
+    return tuple(query_key)
+
+
+def _get_search_cache_key(data: SearchRequestModel) -> tuple:
+    """
+    Builds a hashable key which identifies the search request. The key also contains the flow address and the
+    credentials, since results must only be shared between identical callers of the same flow.
+    """
+    return (
+        data.host,
+        data.port,
+        data.api_key,
+        json.dumps(data.jwt, sort_keys=True),
+        _get_query_key(data.query),
+        data.limit,
+        tuple(sorted(data.filters.items())),
+    )
+
+
+def _get_cached_search(key: tuple):
+    with _search_cache_lock:
+        cached = _search_cache.get(key)
+        if cached is None:
+            return None
+        timestamp, matches = cached
+        if time.monotonic() - timestamp > api_settings.DEFAULT_SEARCH_CACHE_TTL:
+            del _search_cache[key]
+            return None
+        _search_cache.move_to_end(key)
+        return matches
+
+
+def _set_cached_search(key: tuple, matches: DocumentArray):
+    with _search_cache_lock:
+        _search_cache[key] = (time.monotonic(), matches)
+        _search_cache.move_to_end(key)
+        while len(_search_cache) > api_settings.DEFAULT_SEARCH_CACHE_SIZE:
+            _search_cache.popitem(last=False)
+            logger.debug(
+                f'Evicted least recently used search result, cache size: {len(_search_cache)}'
+            )
+
+
+def clear_search_cache(host: Optional[str] = None, port: Optional[int] = None):
+    """
+    Removes cached search results. If a host is given, only the results of the flow
+    at this host and port are removed, e.g. after data was indexed into it.
+    """
+    with _search_cache_lock:
+        if host is None:
+            _search_cache.clear()
+            return
+        for key in [key for key in _search_cache if key[:2] == (host, port)]:
+            del _search_cache[key]
+
+
+def _match_to_dict(doc: Document, binary: bool = False) -> dict:
+    """
+    Converts a match to the dictionary of a `SearchResponseModel`.
+
+    :param doc: the matching document
+    :param binary: if True, the blob is kept as bytes, otherwise it is base64 encoded
+    :return: dictionary with the id, scores, tags and fields of the match
+    """
+    # todo: use multimodal doc in the future
+    scores = {}
+    for score_name, named_score in doc.scores.items():
+        scores[score_name] = named_score.to_dict()
+    if doc.uri:
+        result = {'uri': doc.uri}
+    elif doc.blob:
+        result = {
+            'blob': doc.blob if binary else base64.b64encode(doc.blob).decode('utf-8')
+        }
+    elif doc.text:
+        result = {'text': doc.text}
+    return {
+        'id': doc.id,
+        'scores': scores,
+        'tags': doc.tags,
+        'fields': {'result_field': result},
+    }
+
+
+def _matches_to_response(matches: DocumentArray) -> List[SearchResponseModel]:
+    """Converts the matches of a query document to the response of the search endpoint."""
+    return [SearchResponseModel(**_match_to_dict(doc)) for doc in matches]
+
+
+def _accepts_msgpack(request: Request) -> bool:
+    return MSGPACK_MEDIA_TYPE in request.headers.get('accept', '')
+
+
+def _msgpack_response(content) -> Response:
+    return Response(content=msgpack.packb(content), media_type=MSGPACK_MEDIA_TYPE)
+
 
 @router.post(
     "/index",
@@ -29,7 +206,7 @@ def index(data: IndexRequestModel):
     index_docs = DocumentArray()
 
     user_input = fetch_user_input(data)
-    data_class = create_dataclass(user_input)
+    data_class = _get_data_class(user_input)
 
     for field_dict, tags_dict in data.data:
         doc = field_dict_to_mm_doc(
@@ -45,6 +222,8 @@ def index(data: IndexRequestModel):
         inputs=index_docs,
         endpoint='/index',
     )
+    # the cached results of the flow don't contain the new documents
+    clear_search_cache(data.host, data.port)
 
 
 @router.post(
@@ -52,44 +231,76 @@ def index(data: IndexRequestModel):
     response_model=List[SearchResponseModel],
     summary='Search data via query',
 )
-def search(data: SearchRequestModel):
-    # temporary class until actual mm docs are created
-    @dataclass
-    class MMQueryDoc:
-        query_text: Text = field(default=None)
-        query_image: Image = field(default=None)
-        query_video: Video = field(default=None)
+def search(data: SearchRequestModel, request: Request):
+    """
+    Search for a single query. Send the header `Accept: application/msgpack` to receive
+    the matches msgpack encoded, with blobs as raw bytes.
+    """
+    # the key must be computed before the query doc is created, as this modifies the query fields
+    cache_key = _get_search_cache_key(data)
+    matches = _get_cached_search(cache_key)
+    if matches is None:
+        query_doc = field_dict_to_mm_doc(data.query, data_class=MMQueryDoc)
+
+        docs = jina_client_post(
+            endpoint='/search',
+            inputs=query_doc,
+            parameters={
+                'limit': data.limit,
+                'filter': _get_query_filter(data.filters),
+            },
+            request_model=data,
+        )
+        matches = docs[0].matches
+        _set_cached_search(cache_key, matches)
+    if _accepts_msgpack(request):
+        return _msgpack_response([_match_to_dict(doc, binary=True) for doc in matches])
+    return _matches_to_response(matches)
 
-    query_doc = field_dict_to_mm_doc(data.query, data_class=MMQueryDoc)
 
-    query_filter = {key: {'$eq': value} for key, value in data.filters.items()}
+@router.post(
+    "/batch_search",
+    response_model=List[List[SearchResponseModel]],
+    summary='Search data via a batch of queries',
+)
+def batch_search(data: BatchSearchRequestModel, request: Request):
+    """
+    Search for multiple queries with a single call to the flow. The results are returned
+    as one list of matches per query, in the same order as the queries.
+    Duplicate queries are only sent once to the flow.
+    Send the header `Accept: application/msgpack` to receive the matches msgpack encoded.
+    """
+    if not data.queries:
+        return []
+    # maps the query key to the index of the query doc which is sent to the flow
+    unique_query_indices: Dict[tuple, int] = {}
+    query_to_unique_index = []
+    unique_query_docs = DocumentArray()
+    for query in data.queries:
+        query_key = _get_query_key(query)
+        if query_key not in unique_query_indices:
+            unique_query_indices[query_key] = len(unique_query_docs)
+            unique_query_docs.append(field_dict_to_mm_doc(query, data_class=MMQueryDoc))
+        query_to_unique_index.append(unique_query_indices[query_key])
 
     docs = jina_client_post(
         endpoint='/search',
-        inputs=query_doc,
-        parameters={'limit': data.limit, 'filter': query_filter},
+        inputs=unique_query_docs,
+        parameters={'limit': data.limit, 'filter': _get_query_filter(data.filters)},
         request_model=data,
+        # the results are mapped back to the queries by position, which requires a
+        # single request, as the client doesn't keep the order across requests
+        request_size=len(unique_query_docs),
     )
-    matches = []
-    for doc in docs[0].matches:
-        # todo: use multimodal doc in the future
-        scores = {}
-        for score_name, named_score in doc.scores.items():
-            scores[score_name] = named_score.to_dict()
-        if doc.uri:
-            result = {'uri': doc.uri}
-        elif doc.blob:
-            result = {'blob': base64.b64encode(doc.blob).decode('utf-8')}
-        elif doc.text:
-            result = {'text': doc.text}
-        match = SearchResponseModel(
-            id=doc.id,
-            scores=scores,
-            tags=doc.tags,
-            fields={'result_field': result},
+    matches_per_query = [docs[index].matches for index in query_to_unique_index]
+    if _accepts_msgpack(request):
+        return _msgpack_response(
+            [
+                [_match_to_dict(doc, binary=True) for doc in matches]
+                for matches in matches_per_query
+            ]
         )
-        matches.append(match)
-    return matches
+    return [_matches_to_response(matches) for matches in matches_per_query]
 
 
 @router.post(
@@ -585,7 +585,7 @@ def clear_text():
 
 
 def load_data(data_path: str) -> DocumentArray:
-    if data_path.startswith('http'):
+    if data_path.startswith(('http://', 'https://')):
         os.makedirs('data/tmp', exist_ok=True)
         url = data_path
         data_path = (
@@ -1,7 +1,12 @@
 import base64
-import functools
+import hashlib
+import threading
+from collections import OrderedDict
 from collections.abc import Collection, Hashable, Mapping
+from typing import List
 
+import msgpack
+import orjson
 import requests
 import streamlit as st
 from docarray import Document, DocumentArray
@@ -10,43 +15,57 @@ from frozendict import frozendict
 
 from .constants import Parameters
 
+# reuse connections to the bff across requests to avoid a new TCP and TLS handshake per call
+_session = requests.Session()
+
+CALL_FLOW_CACHE_SIZE = 10
+MSGPACK_MEDIA_TYPE = 'application/msgpack'
+_call_flow_cache: 'OrderedDict[tuple, DocumentArray]' = OrderedDict()
+# the cache is shared by the threads of all streamlit sessions
+_call_flow_cache_lock = threading.Lock()
+
+
+def _freeze_mapping(thing):
+    return frozendict({k: deep_freeze(v) for k, v in thing.items()})
+
+
+def _freeze_collection(thing):
+    return tuple(deep_freeze(i) for i in thing)
+
+
+def _identity(thing):
+    return thing
+
+
+# exact type lookup for the common types, which avoids the chain of isinstance checks
+_FREEZERS = {
+    dict: _freeze_mapping,
+    list: _freeze_collection,
+    tuple: _freeze_collection,
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+}
+
 
 def deep_freeze(thing):
-    if thing is None or isinstance(thing, str):
+    freezer = _FREEZERS.get(type(thing))
+    if freezer is not None:
+        return freezer(thing)
+    elif isinstance(thing, str):
         return thing
     elif isinstance(thing, Mapping):
-        return frozendict({k: deep_freeze(v) for k, v in thing.items()})
+        return _freeze_mapping(thing)
     elif isinstance(thing, Collection):
-        return tuple(deep_freeze(i) for i in thing)
+        return _freeze_collection(thing)
     elif not isinstance(thing, Hashable):
         raise TypeError(f"un-freezable type: '{type(thing)}'")
     else:
         return thing
 
 
-def deep_freeze_args(func):
-    """
-    Transform mutable dictionary into immutable. Useful to be compatible with cache.
-    """
-
-    @functools.wraps(func)
-    def wrapped(*args, **kwargs):
-        return func(*deep_freeze(args), **deep_freeze(kwargs))
-
-    return wrapped
-
-
-def unfreeze_param(data):
-    new_data = {}
-    for k, v in data.items():
-        if isinstance(v, frozendict):
-            d = unfreeze_param(v)
-            new_data[k] = dict(d)
-        else:
-            new_data[k] = v
-    return new_data
-
-
 def get_query_params() -> Parameters:
     query_parameters = st.experimental_get_query_params()
     parameters = Parameters()
@@ -60,21 +79,12 @@ def get_query_params() -> Parameters:
     return parameters
 
 
-def search(
-    attribute_name,
-    attribute_value,
-    jwt,
-    top_k=None,
-    filter_dict=None,
-    endpoint='search',
-):
-    print(f'Searching by {attribute_name}')
+def get_domain_and_request_data(jwt, top_k=None, filter_dict=None):
     params = get_query_params()
     if params.host == 'gateway':  # need to call now-bff as we communicate between pods
         domain = f"http://now-bff"
     else:
         domain = f"https://nowrun.jina.ai"
-    URL_HOST = f"{domain}/api/v1/search-app/{endpoint}"
 
     updated_dict = {}
     if filter_dict is not None:
@@ -84,85 +94,235 @@ def search(
         'limit': top_k if top_k else params.top_k,
         'filters': updated_dict,
     }
-    if endpoint == 'suggestion':
-        data[attribute_name] = attribute_value
-    elif endpoint == 'search':
-        data['query'] = {f'query_{attribute_name}': {attribute_name: attribute_value}}
     # in case the jwt is none, no jwt will be sent. This is the case when no authentication is used for that flow
     if jwt is not None:
         data['jwt'] = jwt
     if params.port:
         data['port'] = params.port
+    return domain, data
+
+
+def search(
+    attribute_name,
+    attribute_value,
+    jwt,
+    top_k=None,
+    filter_dict=None,
+    endpoint='search',
+):
+    print(f'Searching by {attribute_name}')
+    domain, data = get_domain_and_request_data(jwt, top_k, filter_dict)
+    URL_HOST = f"{domain}/api/v1/search-app/{endpoint}"
+
+    if endpoint == 'suggestion':
+        data[attribute_name] = attribute_value
+    elif endpoint == 'search':
+        data['query'] = {f'query_{attribute_name}': {attribute_name: attribute_value}}
 
     return call_flow(URL_HOST, data, attribute_name, domain, endpoint)
 
 
+def search_batch(attribute_name, attribute_values, jwt, top_k=None, filter_dict=None):
+    """
+    Search for multiple values of the same attribute with a single request to the bff.
+    Duplicate values are only sent once. Meant for scripted evaluation loops, which
+    score many queries at once.
+
+    :return: list of `DocumentArray` with the matches, one per value in
+        `attribute_values`, or None if the request failed
+    """
+    print(f'Batch searching by {attribute_name}')
+    st.session_state.search_count += 1
+    domain, data = get_domain_and_request_data(jwt, top_k, filter_dict)
+    unique_values = list(dict.fromkeys(attribute_values))
+    data['queries'] = [
+        {f'query_{attribute_name}': {attribute_name: attribute_value}}
+        for attribute_value in unique_values
+    ]
+    response = _session.post(
+        f"{domain}/api/v1/search-app/batch_search",
+        json=data,
+        headers={
+            "Content-Type": "application/json; charset=utf-8",
+            "Accept": MSGPACK_MEDIA_TYPE,
+        },
+    )
+    json_response = None
+    try:
+        json_response = parse_response(response)
+        value_to_docs = {
+            value: response_json_to_docs(matches_json)
+            for value, matches_json in zip(unique_values, json_response)
+        }
+    except Exception:
+        _set_error_msg(response, json_response)
+        return None
+
+    st.session_state.error_msg = None
+    _update_cloud_uris(list(value_to_docs.values()), data, domain)
+    return [value_to_docs[value] for value in attribute_values]
+
+
 def get_suggestion(text, jwt):
     return search('text', text, jwt, endpoint='suggestion')
 
 
-@deep_freeze_args
-@functools.lru_cache(maxsize=10, typed=False)
+def parse_response(response: requests.Response):
+    """Parses the response of the bff, which is either msgpack or json encoded."""
+    if response.headers.get('Content-Type', '').startswith(MSGPACK_MEDIA_TYPE):
+        return msgpack.unpackb(response.content, raw=False)
+    return orjson.loads(response.content)
+
+
+def _response_json_to_doc(response_json) -> Document:
+    content = list(response_json['fields'].values())[0]
+    # blobs are only base64 encoded if the response is json encoded
+    if isinstance(content.get('blob'), str):
+        content = {**content, 'blob': base64.b64decode(content['blob'])}
+    return Document(
+        id=response_json['id'],
+        tags=response_json['tags'],
+        scores={
+            metric: NamedScore(value=score['value'])
+            for metric, score in response_json['scores'].items()
+        },
+        **content,
+    )
+
+
+def response_json_to_docs(response_json_list) -> DocumentArray:
+    """Converts the json response of the bff search endpoint into a `DocumentArray`."""
+    # todo: use multimodal doc in the future
+    return DocumentArray(
+        _response_json_to_doc(response_json) for response_json in response_json_list
+    )
+
+
+def _get_query_digest(query) -> bytes:
+    """Hashes the query values, such that large base64 encoded blobs are not part of the cache key."""
+    query_hash = hashlib.blake2b(digest_size=16)
+    for field_name, field_value in sorted(query.items()):
+        for attribute_name, value in sorted(field_value.items()):
+            value = str(value).encode('utf-8')
+            query_hash.update(f'{field_name}.{attribute_name}:{len(value)}:'.encode())
+            query_hash.update(value)
+    return query_hash.digest()
+
+
+def _get_call_flow_cache_key(url_host, data, attribute_name, domain, endpoint):
+    request_params = {k: v for k, v in data.items() if k != 'query'}
+    return (
+        url_host,
+        attribute_name,
+        domain,
+        endpoint,
+        deep_freeze(request_params),
+        _get_query_digest(data.get('query') or {}),
+    )
+
+
 def call_flow(url_host, data, attribute_name, domain, endpoint):
+    """Calls the bff and caches the results of the last `CALL_FLOW_CACHE_SIZE` successful requests."""
+    key = _get_call_flow_cache_key(url_host, data, attribute_name, domain, endpoint)
+    with _call_flow_cache_lock:
+        docs = _call_flow_cache.get(key)
+        if docs is not None:
+            _call_flow_cache.move_to_end(key)
+            return docs
+
+    docs = _call_flow(url_host, dict(data), attribute_name, domain, endpoint)
+    if docs is not None:
+        with _call_flow_cache_lock:
+            _call_flow_cache[key] = docs
+            _call_flow_cache.move_to_end(key)
+            while len(_call_flow_cache) > CALL_FLOW_CACHE_SIZE:
+                _call_flow_cache.popitem(last=False)
+    return docs
+
+
+def _call_flow(url_host, data, attribute_name, domain, endpoint):
     st.session_state.search_count += 1
-    data = unfreeze_param(data)
 
-    response = requests.post(
-        url_host, json=data, headers={"Content-Type": "application/json; charset=utf-8"}
+    response = _session.post(
+        url_host,
+        json=data,
+        headers={
+            "Content-Type": "application/json; charset=utf-8",
+            # blobs of the matches are sent as raw bytes instead of base64 encoded strings
+            "Accept": MSGPACK_MEDIA_TYPE,
+        },
     )
 
+    # the body is parsed at most once, also when it turns out to be an error message
+    json_response = None
     try:
         if endpoint == 'suggestion':
             docs = DocumentArray.from_json(response.content)
         elif endpoint == 'search':
-            docs = DocumentArray()
-            # todo: use multimodal doc in the future
-            for response_json in response.json():
-                content = list(response_json['fields'].values())[0]
-                doc = Document(
-                    id=response_json['id'],
-                    tags=response_json['tags'],
-                    **content,
-                )
-                if doc.blob:
-                    base64_bytes = doc.blob.encode('utf-8')
-                    doc.blob = base64.decodebytes(base64_bytes)
-                for metric, value in response_json['scores'].items():
-                    doc.scores[metric] = NamedScore(value=value['value'])
-                docs.append(doc)
+            json_response = parse_response(response)
+            docs = response_json_to_docs(json_response)
     except Exception:
-        try:
-            json_response = response.json()
-
-            if response.status_code == 401:
-                st.session_state.error_msg = json_response['detail']
-            else:
-                st.session_state.error_msg = json_response['message'].replace('"', "'")
-        except Exception:
-            st.session_state.error_msg = response.text
+        _set_error_msg(response, json_response)
         return None
 
     st.session_state.error_msg = None
-
-    # update URI to temporary URI for any cloud bucket resources
-    docs_cloud = docs.find({'uri': {'$regex': r"\As3://"}})
-    if len(docs_cloud) > 0:
-        del data['query']
-        del data['limit']
-        data['ids'] = docs_cloud[:, 'id']
-        data['uris'] = docs_cloud[:, 'uri']
-
-        response_temp_links = requests.post(
-            f"{domain}/api/v1/cloud-bucket-utils/temp_link",
-            json=data,
-            headers={"Content-Type": "application/json; charset=utf-8"},
-        )
-        docs_temp_links = DocumentArray.from_json(response_temp_links.content)
-        for _id, _uri in zip(*docs_temp_links[:, ['id', 'uri']]):
-            docs[_id].uri = _uri
+    _update_cloud_uris([docs], data, domain)
     return docs
 
 
+def _set_error_msg(response: requests.Response, json_response=None):
+    """Shows the error message of a failed request to the bff."""
+    try:
+        if json_response is None:
+            json_response = parse_response(response)
+
+        if response.status_code == 401:
+            st.session_state.error_msg = json_response['detail']
+        else:
+            st.session_state.error_msg = json_response['message'].replace('"', "'")
+    except Exception:
+        st.session_state.error_msg = response.text
+
+
+def _update_cloud_uris(docs_list: List[DocumentArray], data: dict, domain: str):
+    """
+    Updates the URIs of cloud bucket resources to temporary URIs. The temporary links of
+    all documents are requested at once.
+
+    :param docs_list: the `DocumentArray`s with the matches
+    :param data: the data of the search request, which contains the credentials
+    :param domain: the domain of the bff
+    """
+    # single columns, as unpacking multiple columns of an empty DocumentArray fails
+    ids_and_uris = [(docs[:, 'id'], docs[:, 'uri']) for docs in docs_list]
+    cloud_uris = {
+        _id: _uri
+        for ids, uris in ids_and_uris
+        for _id, _uri in zip(ids, uris)
+        if _uri and _uri.startswith('s3://')
+    }
+    if not cloud_uris:
+        return
+
+    temp_link_data = {
+        key: value
+        for key, value in data.items()
+        if key not in ('query', 'queries', 'limit')
+    }
+    temp_link_data['ids'] = list(cloud_uris.keys())
+    temp_link_data['uris'] = list(cloud_uris.values())
+    response_temp_links = _session.post(
+        f"{domain}/api/v1/cloud-bucket-utils/temp_link",
+        json=temp_link_data,
+        headers={"Content-Type": "application/json; charset=utf-8"},
+    )
+    docs_temp_links = DocumentArray.from_json(response_temp_links.content)
+    temp_uris = dict(zip(docs_temp_links[:, 'id'], docs_temp_links[:, 'uri']))
+    for docs, (ids, uris) in zip(docs_list, ids_and_uris):
+        if len(docs):
+            docs[:, 'uri'] = [temp_uris.get(_id, _uri) for _id, _uri in zip(ids, uris)]
+
+
 def search_by_text(search_text, jwt, filter_selection) -> DocumentArray:
     return search('text', search_text, jwt, filter_dict=filter_selection)
 
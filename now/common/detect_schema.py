@@ -164,10 +164,7 @@ def identify_folder_structure(file_paths: List[str], separator: str) -> str:
             "Files have differing depth, please check documentation https://now.jina.ai"
         )
     # check if all files are in the same folder
-    if (
-        len(set([separator.join(path.split(separator)[:-1]) for path in file_paths]))
-        != 1
-    ):
+    if len(set(path.rpartition(separator)[0] for path in file_paths)) != 1:
         return 'sub_folders'
     return 'single_folder'
 
@@ -8,7 +8,10 @@ from __future__ import annotations, print_function, unicode_literals
 
 import importlib
 import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from hubble import AuthenticationRequiredError
 from kubernetes import client, config
@@ -25,6 +28,7 @@ from now.log import yaspin_extended
 from now.now_dataclasses import DialogOptions, UserInput
 from now.utils import (
     _get_context_names,
+    clear_hubble_info_cache,
     get_info_hubble,
     jina_auth_login,
     sigmap,
@@ -34,6 +38,10 @@ from now.utils import (
 NEW_CLUSTER = {'name': '🐣 create new', 'value': 'new'}
 AVAILABLE_SOON = 'will be available in upcoming versions'
 
+KUBE_PROBE_CACHE_TTL = 60  # seconds
+# maps the kube context to the time of the probe and whether the cluster was reachable
+_kube_probe_cache: dict[str, tuple[float, bool]] = {}
+
 
 # Make sure you add this dialog option to your app in order of dependency, i.e., if some dialog option depends on other
 # than the parent should be called first before the dependant can called.
@@ -109,16 +117,20 @@ def check_login_dataset(user_input: UserInput):
         _jina_auth_login(user_input)
 
 
-def _get_demo_data_choices(user_input: UserInput, **kwargs):
-    all_demo_datasets = []
-    for demo_datasets in AVAILABLE_DATASETS.values():
-        all_demo_datasets.extend(demo_datasets)
+@lru_cache(maxsize=None)
+def _build_demo_data_choices():
     return [
         {'name': demo_data.display_name, 'value': demo_data.name}
-        for demo_data in all_demo_datasets
+        for demo_datasets in AVAILABLE_DATASETS.values()
+        for demo_data in demo_datasets
     ]
 
 
+def _get_demo_data_choices(user_input: UserInput, **kwargs):
+    # the demo datasets don't depend on the user input, so the choices are built once
+    return _build_demo_data_choices()
+
+
 DEMO_DATA = DialogOptions(
     name='dataset_name',
     prompt_message='What demo dataset do you want to use?',
@@ -367,20 +379,26 @@ def _add_additional_users(user_input: UserInput, **kwargs):
 def _check_if_namespace_exist():
     config.load_kube_config()
     v1 = client.CoreV1Api()
-    return 'nowapi' in [item.metadata.name for item in v1.list_namespace().items]
+    return any(item.metadata.name == 'nowapi' for item in v1.list_namespace().items)
 
 
-def construct_app(app_name: str):
+@lru_cache(maxsize=None)
+def _load_app_class(app_name: str):
     return getattr(
         importlib.import_module(f'now.app.{app_name}.app'),
         f'{to_camel_case(app_name)}',
-    )()
+    )
+
+
+def construct_app(app_name: str):
+    return _load_app_class(app_name)()
 
 
 def _jina_auth_login(user_input: UserInput, **kwargs):
     try:
         jina_auth_login()
     except AuthenticationRequiredError:
+        clear_hubble_info_cache()
         with yaspin_extended(
             sigmap=sigmap, text='Log in to Jina AI Cloud', color='green'
         ) as spinner:
@@ -398,23 +416,32 @@ def _construct_local_cluster_choices(user_input: UserInput, **kwargs):
     choices = [NEW_CLUSTER]
     # filter contexts with `gke`
     if len(context_names) > 0 and len(context_names[0]) > 0:
-        context_names = [
-            context
-            for context in context_names
-            if 'gke' not in context and _cluster_running(context)
-        ]
+        context_names = [context for context in context_names if 'gke' not in context]
+        # each probe is a round trip to a different cluster, therefore they are done in parallel
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            running = list(executor.map(_cluster_running, context_names))
+        context_names = [name for name, up in zip(context_names, running) if up]
         choices = context_names + choices
     return choices
 
 
 def _cluster_running(cluster):
-    config.load_kube_config(context=cluster)
-    v1 = client.CoreV1Api()
+    """
+    Checks whether the cluster of the kube context is reachable. The result is cached for `KUBE_PROBE_CACHE_TTL`
+    seconds, such that re-entering the dialog doesn't probe all clusters again.
+    """
+    cached = _kube_probe_cache.get(cluster)
+    if cached is not None and time.monotonic() - cached[0] < KUBE_PROBE_CACHE_TTL:
+        return cached[1]
     try:
-        v1.list_namespace()
-    except Exception as e:
-        return False
-    return True
+        # a separate api client per context doesn't modify the global kube config, so probes can run in parallel
+        v1 = client.CoreV1Api(api_client=config.new_client_from_config(context=cluster))
+        v1.list_namespace(timeout_seconds=3, _request_timeout=3)
+        is_running = True
+    except Exception:
+        is_running = False
+    _kube_probe_cache[cluster] = (time.monotonic(), is_running)
+    return is_running
 
 
 app_config = [APP_NAME]
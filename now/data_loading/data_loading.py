@@ -1,7 +1,11 @@
+import glob
 import json
 import os
+import threading
 from collections import defaultdict
-from typing import Dict, List, Type
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Type
 
 from docarray import Document, DocumentArray
 from docarray.dataclasses import is_multimodal
@@ -16,6 +20,17 @@ from now.log import yaspin_extended
 from now.now_dataclasses import UserInput
 from now.utils import sigmap
 
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+# simdjson parsers are not thread-safe, therefore each thread reuses its own parser
+_thread_local = threading.local()
+
+# the demo datasets take up to several GB, therefore only the most recently used ones are kept on disk
+DEMO_DATASET_CACHE_SIZE = 3
+
 
 def load_data(user_input: UserInput, data_class=None) -> DocumentArray:
     """Based on the user input, this function will pull the configured DocumentArray dataset ready for the preprocessing
@@ -38,7 +53,7 @@ def load_data(user_input: UserInput, data_class=None) -> DocumentArray:
         da = _extract_es_data(user_input)
     elif user_input.dataset_type == DatasetTypes.DEMO:
         print('⬇  Download DocumentArray dataset')
-        da = DocumentArray.pull(name=user_input.dataset_name, show_progress=True)
+        da = _pull_demo_dataset(user_input.dataset_name)
     if da is None:
         raise ValueError(
             f'Could not load DocumentArray dataset. Please check your configuration: {user_input}.'
@@ -64,6 +79,53 @@ def _pull_docarray(dataset_name: str):
         )
 
 
+def _pull_demo_dataset(dataset_name: str) -> DocumentArray:
+    """
+    Pulls a demo dataset and caches it on disk, such that it is only downloaded once.
+    The cache folder can be set via `NOW_PULL_CACHE` and the cache is bypassed if `NOW_PULL_REFRESH` is set to
+    `1` or `true`. Only the `DEMO_DATASET_CACHE_SIZE` most recently used datasets are kept in the cache.
+
+    :param dataset_name: The name of the demo dataset.
+    :return: The demo dataset.
+    """
+    cache_dir = os.path.expanduser(
+        os.environ.get('NOW_PULL_CACHE', '~/.cache/jina-now/datasets')
+    )
+    cache_path = os.path.join(cache_dir, f'{dataset_name}.bin')
+    refresh = os.environ.get('NOW_PULL_REFRESH', '').lower() in ('1', 'true')
+    if os.path.isfile(cache_path) and not refresh:
+        # the modification time tracks when the dataset was used last
+        os.utime(cache_path)
+        return DocumentArray.load_binary(cache_path)
+
+    docs = DocumentArray.pull(name=dataset_name, show_progress=True)
+    os.makedirs(cache_dir, exist_ok=True)
+    # write to a temporary file first, such that an interrupted run doesn't leave a corrupted cache
+    tmp_cache_path = f'{cache_path}.{os.getpid()}.tmp'
+    docs.save_binary(tmp_cache_path)
+    os.replace(tmp_cache_path, cache_path)
+    _evict_demo_datasets(cache_dir)
+    return docs
+
+
+def _evict_demo_datasets(cache_dir: str):
+    """
+    Removes the least recently used demo datasets from the cache, such that at most `DEMO_DATASET_CACHE_SIZE`
+    datasets are kept.
+
+    :param cache_dir: The folder of the cached demo datasets.
+    """
+    cache_paths = sorted(
+        glob.glob(os.path.join(cache_dir, '*.bin')), key=os.path.getmtime, reverse=True
+    )
+    for cache_path in cache_paths[DEMO_DATASET_CACHE_SIZE:]:
+        try:
+            os.remove(cache_path)
+        except FileNotFoundError:
+            # already removed by another run
+            pass
+
+
 def _extract_es_data(user_input: UserInput) -> DocumentArray:
     query = {
         'query': {'match_all': {}},
@@ -135,15 +197,12 @@ def from_files_local(
     :return: A DocumentArray with the documents
     """
 
-    file_paths = []
-    for root, dirs, files in os.walk(path):
-        file_paths.extend(
-            [os.path.join(root, file) for file in files if not file.startswith('.')]
-        )
+    folders_and_file_paths = list(_iter_folders_and_files(path))
+    file_paths = [file_path for _, file_path in folders_and_file_paths]
     folder_structure = identify_folder_structure(file_paths, os.sep)
     if folder_structure == 'sub_folders':
         docs = create_docs_from_subdirectories(
-            file_paths, fields, files_to_dataclass_fields, data_class
+            folders_and_file_paths, fields, files_to_dataclass_fields, data_class
         )
     else:
         docs = create_docs_from_files(
@@ -152,8 +211,24 @@ def from_files_local(
     return DocumentArray(docs)
 
 
+def _iter_folders_and_files(path: str) -> Iterator[Tuple[str, str]]:
+    """
+    Recursively iterates over all non-hidden files in the directory. Symlinks to directories are not followed.
+
+    :param path: The path to the directory
+
+    :return: Iterator over tuples of the folder containing the file and the full file path
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_folders_and_files(entry.path)
+            elif not entry.name.startswith('.') and not entry.is_dir():
+                yield path, entry.path
+
+
 def create_docs_from_subdirectories(
-    file_paths: List,
+    folders_and_file_paths: Iterable[Tuple[str, str]],
     fields: List[str],
     files_to_dataclass_fields: Dict,
     data_class: Type,
@@ -163,7 +238,7 @@ def create_docs_from_subdirectories(
     """
     Creates a Multi Modal documentarray over a list of subdirectories.
 
-    :param file_paths: The list of file paths
+    :param folders_and_file_paths: Tuples of the folder containing the file and the file path
     :param fields: The fields to search for in the directory
     :param files_to_dataclass_fields: The mapping of the files to the dataclass fields
     :param data_class: The dataclass to use for the document
@@ -173,39 +248,85 @@ def create_docs_from_subdirectories(
     :return: The list of documents
     """
 
-    docs = []
     folder_files = defaultdict(list)
-    for file in file_paths:
-        path_to_last_folder = (
-            '/'.join(file.split('/')[:-1])
-            if is_s3_dataset
-            else os.sep.join(file.split(os.sep)[:-1])
-        )
-        folder_files[path_to_last_folder].append(file)
-    for folder, files in folder_files.items():
-        kwargs = {}
-        for file in files:
-            file, file_full_path = _extract_file_and_full_file_path(
-                file, path, is_s3_dataset
-            )
-            if file in fields:
-                kwargs[files_to_dataclass_fields[file]] = file_full_path
-                continue
-            if file.endswith('.json'):
-                if is_s3_dataset:
-                    for field in data_class.__annotations__.keys():
-                        if field not in kwargs.keys():
-                            kwargs[field] = file_full_path
-                else:
-                    with open(file_full_path) as f:
-                        data = json.load(f)
-                    for el, value in data.items():
-                        if el in files_to_dataclass_fields.keys():
-                            kwargs[files_to_dataclass_fields[el]] = value
-        docs.append(Document(data_class(**kwargs)))
+    for folder, file in folders_and_file_paths:
+        folder_files[folder].append(file)
+    create_doc = partial(
+        _create_doc_from_folder_files,
+        fields=fields,
+        files_to_dataclass_fields=files_to_dataclass_fields,
+        data_class=data_class,
+        path=path,
+        is_s3_dataset=is_s3_dataset,
+    )
+    # loading the files is I/O and decoding bound, therefore the folders are processed in parallel threads
+    with ThreadPoolExecutor() as executor:
+        docs = list(executor.map(create_doc, folder_files.values()))
     return docs
 
 
+def _create_doc_from_folder_files(
+    files: List[str],
+    fields: List[str],
+    files_to_dataclass_fields: Dict,
+    data_class: Type,
+    path: str,
+    is_s3_dataset: bool,
+) -> Document:
+    kwargs = {}
+    for file in files:
+        file, file_full_path = _extract_file_and_full_file_path(
+            file, path, is_s3_dataset
+        )
+        if file in fields:
+            kwargs[files_to_dataclass_fields[file]] = file_full_path
+            continue
+        if file.endswith('.json'):
+            if is_s3_dataset:
+                for field in data_class.__annotations__.keys():
+                    if field not in kwargs.keys():
+                        kwargs[field] = file_full_path
+            else:
+                data = _load_json_fields(
+                    file_full_path, files_to_dataclass_fields.keys()
+                )
+                for el, value in data.items():
+                    kwargs[files_to_dataclass_fields[el]] = value
+    return Document(data_class(**kwargs))
+
+
+def _load_json_fields(file_path: str, fields: Iterable[str]) -> Dict:
+    """
+    Loads only the given top-level fields of a json file. If `simdjson` is installed, the file is parsed on demand,
+    such that only the values of the requested fields are materialized.
+
+    :param file_path: The path to the json file
+    :param fields: The fields to load
+
+    :return: Dictionary with the fields which are present in the json file
+    """
+    if simdjson is None:
+        with open(file_path) as f:
+            data = json.load(f)
+        return {el: data[el] for el in fields if el in data}
+
+    if not hasattr(_thread_local, 'json_parser'):
+        # allocating the internal buffers of the parser is expensive, so it is reused for all files
+        _thread_local.json_parser = simdjson.Parser()
+    doc = _thread_local.json_parser.load(file_path)
+    data = {}
+    for el in fields:
+        if el in doc:
+            value = doc[el]
+            # the proxy objects are only valid until the parser is used again
+            if isinstance(value, simdjson.Object):
+                value = value.as_dict()
+            elif isinstance(value, simdjson.Array):
+                value = value.as_list()
+            data[el] = value
+    return data
+
+
 def create_docs_from_files(
     file_paths: List,
     fields: List[str],
@@ -226,21 +347,38 @@ def create_docs_from_files(
 
     :return: A list of documents
     """
-    docs = []
-    for file in file_paths:
-        kwargs = {}
-        file, file_full_path = _extract_file_and_full_file_path(
-            file, path, is_s3_dataset
-        )
-        file_extension = file.split('.')[-1]
-        if (
-            file_extension == fields[0].split('.')[-1]
-        ):  # fields should have only one search field in case of files only
-            kwargs[files_to_dataclass_fields[fields[0]]] = file_full_path
-            docs.append(Document(data_class(**kwargs)))
+    create_doc = partial(
+        _create_doc_from_file,
+        fields=fields,
+        files_to_dataclass_fields=files_to_dataclass_fields,
+        data_class=data_class,
+        path=path,
+        is_s3_dataset=is_s3_dataset,
+    )
+    # loading the files is I/O and decoding bound, therefore they are processed in parallel threads
+    with ThreadPoolExecutor() as executor:
+        docs = [doc for doc in executor.map(create_doc, file_paths) if doc is not None]
     return docs
 
 
+def _create_doc_from_file(
+    file: str,
+    fields: List[str],
+    files_to_dataclass_fields: Dict,
+    data_class: Type,
+    path: str,
+    is_s3_dataset: bool,
+) -> Optional[Document]:
+    file, file_full_path = _extract_file_and_full_file_path(file, path, is_s3_dataset)
+    file_extension = file.split('.')[-1]
+    if (
+        file_extension == fields[0].split('.')[-1]
+    ):  # fields should have only one search field in case of files only
+        kwargs = {files_to_dataclass_fields[fields[0]]: file_full_path}
+        return Document(data_class(**kwargs))
+    return None
+
+
 def _list_files_from_s3_bucket(
     user_input: UserInput, data_class: Type
 ) -> DocumentArray:
@@ -254,11 +392,10 @@ def _list_files_from_s3_bucket(
     """
     bucket, folder_prefix = get_s3_bucket_and_folder_prefix(user_input)
 
-    objects = list(bucket.objects.filter(Prefix=folder_prefix))
     file_paths = [
-        obj.key
-        for obj in objects
-        if not obj.key.endswith('/') and not obj.key.split('/')[-1].startswith('.')
+        key
+        for key in _list_s3_keys(bucket, folder_prefix)
+        if not key.endswith('/') and not key.split('/')[-1].startswith('.')
     ]
 
     folder_structure = identify_folder_structure(file_paths, '/')
@@ -269,7 +406,7 @@ def _list_files_from_s3_bucket(
         spinner.ok('🏭')
         if folder_structure == 'sub_folders':
             docs = create_docs_from_subdirectories(
-                file_paths,
+                [(file[: file.rindex('/')], file) for file in file_paths],
                 user_input.search_fields + user_input.filter_fields,
                 user_input.files_to_dataclass_fields,
                 data_class,
@@ -288,6 +425,39 @@ def _list_files_from_s3_bucket(
     return DocumentArray(docs)
 
 
+def _list_s3_keys(bucket, folder_prefix: str, max_workers: int = 16) -> List[str]:
+    """
+    Lists all keys in the s3 bucket under the folder prefix. The first level sub folders are listed in parallel,
+    since listing a large bucket is bound by the latency of the sequential `ListObjectsV2` requests.
+
+    :param bucket: The s3 bucket
+    :param folder_prefix: The prefix of the folder to list
+    :param max_workers: The number of threads used to list the sub folders
+
+    :return: The list of keys
+    """
+    client = bucket.meta.client
+
+    def _list_prefix(
+        prefix: str, delimiter: Optional[str] = None
+    ) -> Tuple[List[str], List[str]]:
+        keys, sub_prefixes = [], []
+        # without a delimiter, all keys under the prefix are listed
+        delimiter_kwargs = {'Delimiter': delimiter} if delimiter else {}
+        for page in client.get_paginator('list_objects_v2').paginate(
+            Bucket=bucket.name, Prefix=prefix, **delimiter_kwargs
+        ):
+            keys.extend(obj['Key'] for obj in page.get('Contents', []))
+            sub_prefixes.extend(p['Prefix'] for p in page.get('CommonPrefixes', []))
+        return keys, sub_prefixes
+
+    keys, sub_prefixes = _list_prefix(folder_prefix, delimiter='/')
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for sub_prefix_keys, _ in executor.map(_list_prefix, sub_prefixes):
+            keys.extend(sub_prefix_keys)
+    return keys
+
+
 def _extract_file_and_full_file_path(file_path, path=None, is_s3_dataset=False):
     """
     Extracts the file name and the full file path from s3 object.
@@ -299,9 +469,9 @@ def _extract_file_and_full_file_path(file_path, path=None, is_s3_dataset=False):
     :return: The file name and the full file path
     """
     if is_s3_dataset:
-        file = file_path.split('/')[-1]
+        file = file_path.rpartition('/')[2]
         file_full_path = '/'.join(path.split('/')[:3]) + '/' + file_path
     else:
         file_full_path = file_path
-        file = file_path.split(os.sep)[-1]
+        file = file_path.rpartition(os.sep)[2]
     return file, file_full_path
@@ -113,12 +113,11 @@ class NOWBaseIndexer(Executor):
         # add removal of duplicates
         parent_ids = sorted({doc.parent_id for doc in self.document_list})
         # filter by offset and limit
-        filtered_parent_ids = parent_ids[offset : offset + limit]
+        filtered_parent_ids = set(parent_ids[offset : offset + limit])
         # get the documents of filtered parent ids
-        docs = DocumentArray(
-            [doc for doc in self.document_list if doc.parent_id in filtered_parent_ids]
+        return DocumentArray(
+            doc for doc in self.document_list if doc.parent_id in filtered_parent_ids
         )
-        return docs
 
     @staticmethod
     def has_text(doc):
@@ -172,7 +171,8 @@ class NOWBaseIndexer(Executor):
         """
         filter = parameters.get("filter", {})
         if filter:
-            filtered_docs = deepcopy(self.document_list.find(filter=filter))
+            # the found documents are only read, so they don't need to be copied
+            filtered_docs = self.document_list.find(filter=filter)
             self.delete_inmemory_docs_and_tags(filtered_docs)
             self.delete(filtered_docs, parameters, **kwargs)
 
@@ -185,25 +185,55 @@ class NOWBaseIndexer(Executor):
         parameters: dict = {},
         **kwargs,
     ):
-        """Perform a vector similarity search and retrieve `Document` matches."""
+        """Perform a vector similarity search and retrieve `Document` matches.
+        Each root document is a separate query, the returned documents hold the matches
+        of the queries in the same order.
+        """
         limit = int(parameters.get('limit', self.limit))
-        search_filter_raw = parameters.get('filter', {})
-        search_filter_orig = deepcopy(search_filter_raw)
-        docs = docs[ACCESS_PATHS][:1]  # only search on the first document for now
+        search_filter_orig = parameters.get('filter', {})
+        # only search on the first document of each query for now
+        query_docs_per_query = [DocumentArray([doc])[ACCESS_PATHS][:1] for doc in docs]
         # TODO remove this check for empty docs and make sure everything else works
-        if len(docs) == 0:
+        if not any(len(query_docs) for query_docs in query_docs_per_query):
             return
+        docs_with_matches = DocumentArray()
+        for query_docs in query_docs_per_query:
+            if len(query_docs) == 0:
+                # keep the position, such that the results can be mapped to the queries
+                docs_with_matches.append(Document())
+            else:
+                docs_with_matches.extend(
+                    self.search_query(query_docs, parameters, limit, search_filter_orig)
+                )
+        return docs_with_matches
+
+    def search_query(
+        self,
+        docs: DocumentArray,
+        parameters: dict,
+        limit: int,
+        search_filter_orig: dict,
+    ) -> DocumentArray:
+        """Searches the matches of a single query.
+
+        :param docs: `DocumentArray` with the document to search for
+        :param parameters: the parameters of the search request
+        :param limit: the maximum number of matches
+        :param search_filter_orig: the filter of the search request
+        :return: `DocumentArray` with the document and its matches
+        """
+        # add the text filters to a copy, the request parameters must stay unchanged
+        search_filter_raw = dict(search_filter_orig)
         retrieval_limit = limit * 3
 
+        column_names = {col[0] for col in self.columns} if self.columns else set()
         # if OCR detector was used to check if documents contain text in indexed image modality adjust retrieval step
-        if self.columns and TAG_INDEXER_DOC_HAS_TEXT in [
-            col[0] for col in self.columns
-        ]:
+        if TAG_INDEXER_DOC_HAS_TEXT in column_names:
             # enhance filter for one word queries to include the title
             if (
                 len(docs[0].text.split()) == 1
                 and not search_filter_raw
-                and 'title' in [col[0] for col in self.columns]
+                and 'title' in column_names
             ):
                 search_filter_raw = {'title': {'$regex': docs[0].text.lower()}}
             # search for documents which don't contain text
@@ -292,12 +322,14 @@ class NOWBaseIndexer(Executor):
 
             possible_matches = deepcopy(doc.matches[limit // 2 :]) + doc_to_add.matches
             doc.matches = doc.matches[: limit // 2]
+            # look up the matches in a dict instead of going through the DocumentArray id index for each match
+            id_to_match = {match.id: match for match in possible_matches}
             ids_scores = [
                 (match.id, match.scores[score_name].value) for match in possible_matches
             ]
             ids_scores.sort(key=lambda x: x[1], reverse='similarity' in score_name)
             for id, _ in ids_scores:
-                _match = possible_matches[id]
+                _match = id_to_match[id]
                 if _match.id not in parent_ids:
                     if len(doc.matches) >= limit:
                         break
@@ -453,9 +485,12 @@ class NOWBaseIndexer(Executor):
 
     def delete_inmemory_docs_and_tags(self, docs):
         """Delete documents from the in-memory DocumentArray"""
-        for d in docs:
-            del self.document_list[d.id]
-            self.doc_id_tags.pop(d.id)
+        ids_to_delete = {d.id for d in docs}
+        self.document_list = DocumentArray(
+            d for d in self.document_list if d.id not in ids_to_delete
+        )
+        for _id in ids_to_delete:
+            self.doc_id_tags.pop(_id)
 
     def update_inmemory_docs_and_tags(self, docs):
         """Update documents in the in-memory DocumentArray"""
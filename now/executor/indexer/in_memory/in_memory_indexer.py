@@ -18,13 +18,12 @@ class InMemoryIndexer(NOWBaseIndexer):
             yield doc
 
     def convert_filter_syntax(self, search_filter={}, search_filter_not={}):
-        converted_filter = {}
-        for key, val in search_filter.items():
-            converted_filter[f"tags__{key}"] = val
+        converted_filter = {f"tags__{key}": val for key, val in search_filter.items()}
         if search_filter_not:
-            converted_filter['$not'] = {}
-            for key_not, val_not in search_filter_not.items():
-                converted_filter['$not'][f"tags__{key_not}"] = val_not
+            converted_filter['$not'] = {
+                f"tags__{key_not}": val_not
+                for key_not, val_not in search_filter_not.items()
+            }
         return converted_filter
 
     def index(self, docs, parameters, **kwargs):
@@ -34,8 +33,12 @@ class InMemoryIndexer(NOWBaseIndexer):
         self._index.extend(docs)
 
     def delete(self, filtered_docs, *args, **kwargs):
-        for doc in filtered_docs:
-            del self._index[doc.id]
+        # rebuilding the index once is faster than deleting the documents one by one,
+        # as each deletion has to update the offsets of all following documents
+        ids_to_delete = {doc.id for doc in filtered_docs}
+        self._index = DocumentArray(
+            doc for doc in self._index if doc.id not in ids_to_delete
+        )
 
     def search(self, docs, parameters, retrieval_limit, search_filter, **kwargs):
         docs.match(self._index.find(search_filter), limit=retrieval_limit)
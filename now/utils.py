@@ -7,6 +7,7 @@ import shutil
 import signal
 import sys
 import tempfile
+import time
 from collections.abc import MutableMapping
 from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Union
@@ -20,6 +21,10 @@ from pyfiglet import Figlet
 
 from now.thirdparty.PyInquirer.prompt import prompt
 
+HUBBLE_INFO_CACHE_TTL = 300  # seconds
+# maps the hubble token to the time of the request and the user info
+_hubble_info_cache: dict[str, tuple[float, dict]] = {}
+
 
 def download_file(path, r_raw):
     with path.open("wb") as f:
@@ -123,18 +128,33 @@ def jina_auth_login():
     pass
 
 
-def get_info_hubble(user_input):
+def _get_cached_hubble_info():
+    """Returns the hubble user info and token, cached per token for
+    HUBBLE_INFO_CACHE_TTL seconds to avoid a request each time the dialog asks for it.
+    """
+    token = hubble.get_token()
+    cached = _hubble_info_cache.get(token) if token else None
+    if cached is not None and time.monotonic() - cached[0] < HUBBLE_INFO_CACHE_TTL:
+        return cached[1], token
     client = hubble.Client(max_retries=None, jsonify=True)
-    response = client.get_user_info()
-    user_input.admin_emails = (
-        [response['data']['email']] if 'email' in response['data'] else []
-    )
+    data = client.get_user_info()['data']
+    _hubble_info_cache[client.token] = (time.monotonic(), data)
+    return data, client.token
+
+
+def clear_hubble_info_cache():
+    _hubble_info_cache.clear()
+
+
+def get_info_hubble(user_input):
+    data, token = _get_cached_hubble_info()
+    user_input.admin_emails = [data['email']] if 'email' in data else []
     if not user_input.admin_emails:
         print(
             'Your hubble account is not verified. Please verify your account to deploy your flow as admin.'
         )
-    user_input.jwt = {'token': client.token}
-    return response['data'], client.token
+    user_input.jwt = {'token': token}
+    return data, token
 
 
 def print_headline():
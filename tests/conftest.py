@@ -17,12 +17,12 @@ from now.executor.indexer.elastic.es_query_building import SemanticScore
 from now.executor.preprocessor import NOWPreprocessor
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def resources_folder_path(tests_folder_path) -> str:
     return os.path.join(tests_folder_path, 'resources')
 
 
-@pytest.fixture()
+@pytest.fixture(scope='session')
 def tests_folder_path() -> str:
     return os.path.join(os.path.dirname(os.path.realpath(__file__)))
 
@@ -169,6 +169,28 @@ class TestBaseIndexer:
                     <= c.matches[i + 1].scores['cosine'].value
                 )
 
+    def test_search_multiple_queries(self, indexer, metas, setup_qdrant):
+        """Test each query document gets its own matches, in the order of the queries"""
+        docs = self.gen_docs(NUMBER_OF_DOCS)
+        docs_query = deepcopy(docs[[2, 0, 1]])
+        f = Flow().add(
+            uses=indexer,
+            uses_with={
+                'dim': DIM,
+            },
+            uses_metas=metas,
+        )
+        with f:
+            f.post(on='/index', inputs=docs)
+
+            query_res = f.post(on='/search', inputs=docs_query, return_results=True)
+            assert len(query_res) == 3
+            assert [c.matches[0].id for c in query_res] == [
+                '2_child',
+                '0_child',
+                '1_child',
+            ]
+
     def test_search_with_filtering(self, indexer, metas, setup_qdrant):
 
         docs = self.docs_with_tags(NUMBER_OF_DOCS)
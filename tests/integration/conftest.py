@@ -2,9 +2,17 @@ import logging
 import os
 
 import hubble
+import numpy as np
 import pytest
+from docarray import DocumentArray
+from jina import Executor, Flow, requests
 from pytest_mock import MockerFixture
 
+from now.app.search_app import SearchApp
+from now.constants import ACCESS_PATHS
+from now.executor.indexer.in_memory import InMemoryIndexer
+from now.executor.preprocessor import NOWPreprocessor
+
 logging.basicConfig(level=logging.DEBUG)
 log = logging.getLogger(__name__)
 
@@ -34,3 +42,46 @@ def with_hubble_login_patch(mocker: MockerFixture) -> None:
     if 'WOLF_TOKEN' not in os.environ:
         hubble.login()
         os.environ['WOLF_TOKEN'] = hubble.Auth.get_auth_token()
+
+
+class LocalEncoder(Executor):
+    """Replaces the external CLIP encoder in tests which check the transformation and
+    indexing of documents, but not the quality of the embeddings."""
+
+    @requests
+    def encode(self, docs: DocumentArray, parameters: dict = {}, **kwargs):
+        for doc in docs[parameters.get('access_paths', ACCESS_PATHS)]:
+            doc.embedding = np.random.random(512).astype(np.float32)
+
+
+@pytest.fixture(scope='session')
+def base_flow(tmp_path_factory):
+    """Starts a preprocessor, encoder and in-memory indexer flow once per session.
+    Tests that index into it have to delete their documents again."""
+    metas = {'workspace': str(tmp_path_factory.mktemp('workspace'))}
+    f = (
+        Flow()
+        .add(
+            uses=NOWPreprocessor,
+            uses_with={'app': SearchApp().app_name},
+            uses_metas=metas,
+        )
+        .add(uses=LocalEncoder)
+        .add(
+            uses=InMemoryIndexer,
+            uses_with={
+                'columns': [
+                    'split',
+                    'str',
+                    'finetuner_label',
+                    'str',
+                    'content_type',
+                    'str',
+                ],
+                'dim': 512,
+            },
+            uses_metas=metas,
+        )
+    )
+    with f:
+        yield f
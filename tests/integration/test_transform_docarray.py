@@ -1,28 +1,29 @@
 import os
+from copy import deepcopy
 
 import pytest
 from docarray import Document, DocumentArray, dataclass
 from docarray.typing import Image, Text
-from jina import Flow
 
 from now.app.base.transform_docarray import transform_uni_modal_data
-from now.app.search_app import SearchApp
-from now.constants import ACCESS_PATHS, EXTERNAL_CLIP_HOST, DatasetTypes
+from now.constants import ACCESS_PATHS, DatasetTypes
 from now.data_loading.data_loading import load_data
 from now.demo_data import DemoDatasetNames
-from now.executor.indexer.in_memory import InMemoryIndexer
-from now.executor.preprocessor import NOWPreprocessor
 from now.now_dataclasses import UserInput
 
 
-@pytest.fixture
-def single_modal_data():
+def _create_single_modal_data() -> DocumentArray:
     d1 = Document(text='some text', tags={'color': 'red', 'author': 'saba'})
     d2 = Document(text='text some', tags={'color': 'blue', 'author': 'florian'})
     return DocumentArray([d1, d2])
 
 
 @pytest.fixture
+def single_modal_data():
+    return _create_single_modal_data()
+
+
+@pytest.fixture(scope='session')
 def multi_modal_data(resources_folder_path):
     @dataclass
     class Page:
@@ -45,89 +46,100 @@ def multi_modal_data(resources_folder_path):
     return DocumentArray([Document(page) for page in pages])
 
 
-@pytest.mark.parametrize(
-    'input_type, num_expected_matches',
-    [['demo_dataset', 4], ['single_modal', 2], ['multi_modal', 6]],
-)
-def test_transform_inside_flow(
-    input_type, num_expected_matches, single_modal_data, multi_modal_data, tmpdir
-):
-    metas = {'workspace': str(tmpdir)}
+@pytest.fixture(scope='session')
+def demo_dataset_data():
+    """Returns the first two documents of the tumblr demo dataset. They are cached on
+    disk, such that the dataset is only downloaded if the cache is missing."""
+    cache_dir = os.path.join(
+        os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache')), 'now_tests'
+    )
+    cache_path = os.path.join(cache_dir, f'{DemoDatasetNames.TUMBLR_GIFS_10K}_2.bin')
+    if os.path.exists(cache_path):
+        return DocumentArray.load_binary(
+            cache_path, protocol='protobuf', compress='gzip'
+        )
+    user_input = UserInput()
+    user_input.search_fields = []
+    user_input.dataset_type = DatasetTypes.DEMO
+    user_input.dataset_name = DemoDatasetNames.TUMBLR_GIFS_10K
+    data = load_data(user_input)[:2]
+    os.makedirs(cache_dir, exist_ok=True)
+    data.save_binary(cache_path, protocol='protobuf', compress='gzip')
+    return data
+
+
+def _get_user_input(input_type: str) -> UserInput:
     user_input = UserInput()
     if input_type == 'demo_dataset':
-        app_instance = SearchApp()
-        user_input.search_fields = []
         user_input.dataset_type = DatasetTypes.DEMO
         user_input.dataset_name = DemoDatasetNames.TUMBLR_GIFS_10K
-        data = load_data(user_input)[:2]
         user_input.search_fields = ['description', 'video']
         user_input.files_to_dataclass_fields = {
             'description': 'description',
             'video': 'video',
         }
-    elif input_type == 'single_modal':
-        app_instance = SearchApp()
-        data = single_modal_data
-    else:
-        app_instance = SearchApp()
-        data = multi_modal_data
+    elif input_type == 'multi_modal':
         user_input.search_fields = ['main_text', 'image']
         user_input.files_to_dataclass_fields = {
             'main_text': 'main_text',
             'image': 'image',
         }
-    query = Document(text='query_text')
+    return user_input
 
-    f = (
-        Flow()
-        .add(
-            uses=NOWPreprocessor,
-            uses_with={'app': app_instance.app_name},
-            uses_metas=metas,
-        )
-        .add(
-            uses='jinahub+docker://CLIPOnnxEncoder/latest-gpu',
-            host=EXTERNAL_CLIP_HOST,
-            port=443,
-            tls=True,
-            external=True,
-            uses_with={'name': 'ViT-B-32::openai'},
-        )
-        .add(
-            uses=InMemoryIndexer,
-            uses_with={
-                'columns': [
-                    'split',
-                    'str',
-                    'finetuner_label',
-                    'str',
-                    'content_type',
-                    'str',
-                ],
-                'dim': 512,
-            },
-            uses_metas=metas,
-        )
-    )
-    with f:
-        f.post(
+
+def _tag_with_case(data: DocumentArray, input_type: str) -> DocumentArray:
+    """Returns a copy of the data in which the documents that become the indexed
+    chunks are tagged with their case. Documents which already have chunks keep the
+    tags of these chunks, so the chunks are tagged instead of the root."""
+    data = deepcopy(data)
+    for doc in data:
+        for tagged_doc in doc.chunks or [doc]:
+            tagged_doc.tags['case'] = input_type
+    return data
+
+
+@pytest.fixture(scope='module')
+def indexed_transform_flow(base_flow, multi_modal_data, demo_dataset_data):
+    """Indexes the data of all cases once, each document is tagged with its case.
+    The documents are deleted again, as the flow is shared by the whole session."""
+    data_per_case = {
+        'demo_dataset': demo_dataset_data,
+        'single_modal': _create_single_modal_data(),
+        'multi_modal': multi_modal_data,
+    }
+    for input_type, data in data_per_case.items():
+        # each case needs its own user input to be preprocessed
+        base_flow.post(
             '/index',
-            data,
+            _tag_with_case(data, input_type),
             parameters={
-                'user_input': user_input.__dict__,
+                'user_input': _get_user_input(input_type).__dict__,
                 'access_paths': ACCESS_PATHS,
             },
         )
+    yield base_flow
+    base_flow.post('/delete', parameters={'filter': {'tags__case': {'$exists': True}}})
+
+
+@pytest.mark.parametrize(
+    'input_type, num_expected_matches',
+    [['demo_dataset', 4], ['single_modal', 2], ['multi_modal', 6]],
+)
+def test_transform_inside_flow(
+    input_type, num_expected_matches, indexed_transform_flow
+):
+    query = Document(text='query_text')
+    query_res = indexed_transform_flow.post(
+        '/search',
+        query,
+        parameters={
+            'user_input': _get_user_input(input_type).__dict__,
+            'access_paths': ACCESS_PATHS,
+            'filter': {'case': {'$eq': input_type}},
+        },
+        return_results=True,
+    )
 
-        query_res = f.post(
-            '/search',
-            query,
-            parameters={
-                'user_input': user_input.__dict__,
-                'access_paths': ACCESS_PATHS,
-            },
-            return_results=True,
-        )
     assert len(query_res[0].matches) == num_expected_matches
     assert not query_res[0].matches[0].uri.startswith('data:')
 
@@ -7,6 +7,7 @@ from fastapi.testclient import TestClient
 from pytest_mock import MockerFixture
 
 from deployment.bff.app.app import build_app
+from deployment.bff.app.v1.routers.search import clear_search_cache
 
 data_url = 'https://storage.googleapis.com/jina-fashion-data/data/one-line/datasets/jpeg/best-artworks.img10.bin'
 
@@ -50,6 +51,7 @@ def client_with_mocked_jina_client(
         mocker.patch(
             'deployment.bff.app.v1.routers.helper.get_jina_client', _get_jina_client
         )
+        clear_search_cache()
 
         return TestClient(build_app())
 
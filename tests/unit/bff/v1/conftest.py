@@ -1,11 +1,12 @@
 import base64
 import os
 
+import orjson
 import pytest
 from docarray import Document, DocumentArray
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def base64_image_string(resources_folder_path: str) -> str:
     with open(os.path.join(resources_folder_path, 'image', 'a.jpg'), 'rb') as f:
         binary = f.read()
@@ -13,12 +14,10 @@ def base64_image_string(resources_folder_path: str) -> str:
     return img_string
 
 
-@pytest.fixture
-def base64_image_string(resources_folder_path: str) -> str:
-    with open(os.path.join(resources_folder_path, 'image', 'a.jpg'), 'rb') as f:
-        binary = f.read()
-        img_string = base64.b64encode(binary).decode('utf-8')
-    return img_string
+@pytest.fixture(scope='session')
+def image_search_request_body(base64_image_string: str) -> bytes:
+    """The serialized body of a search request with an image query."""
+    return orjson.dumps({'query': {'query_image': {'blob': base64_image_string}}})
 
 
 @pytest.fixture
@@ -1,9 +1,12 @@
 from typing import Callable
 
+import msgpack
+import orjson
 import pytest
 import requests
 from docarray import Document, DocumentArray
 from docarray.typing import Text
+from pytest_mock import MockerFixture
 from starlette import status
 
 from now.now_dataclasses import UserInput
@@ -72,18 +75,45 @@ def test_text_index(
     assert response.status_code == status.HTTP_200_OK
 
 
+def test_index_creates_data_class_once(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+    mocker: MockerFixture,
+):
+    import deployment.bff.app.v1.routers.search as bff_search
+
+    mocker.patch.object(
+        bff_search,
+        'fetch_user_input',
+        lambda data: UserInput(
+            search_fields_modalities={'title': Text}, search_fields=['title']
+        ),
+    )
+    mocker.patch.dict(bff_search._data_class_cache, clear=True)
+    create_dataclass_spy = mocker.spy(bff_search, 'create_dataclass')
+
+    client = client_with_mocked_jina_client(DocumentArray())
+    for _ in range(2):
+        response = client.post(
+            '/api/v1/search-app/index',
+            json={'data': [({'title': {'text': 'Hello'}}, {'tag': 'val'})]},
+        )
+        assert response.status_code == status.HTTP_200_OK
+    assert create_dataclass_spy.call_count == 1
+
+
 def test_text_search_calls_flow(
     client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
     sample_search_response_text: DocumentArray,
-    base64_image_string: str,
+    image_search_request_body: bytes,
 ):
     response = client_with_mocked_jina_client(sample_search_response_text).post(
         '/api/v1/search-app/search',
-        json={'query': {'query_image': {'blob': base64_image_string}}},
+        data=image_search_request_body,
+        headers={'content-type': 'application/json'},
     )
 
     assert response.status_code == status.HTTP_200_OK
-    results = DocumentArray.from_json(response.content)
+    results = DocumentArray.from_list(orjson.loads(response.content))
     # the mock writes the call args into the response tags
     assert results[0].tags['url'] == '/search'
     assert results[0].tags['parameters']['limit'] == 10
@@ -92,24 +122,160 @@ def test_text_search_calls_flow(
 def test_text_search_parse_response(
     client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
     sample_search_response_text: DocumentArray,
-    base64_image_string: str,
+    image_search_request_body: bytes,
 ):
     response_raw = client_with_mocked_jina_client(sample_search_response_text).post(
         '/api/v1/search-app/search',
-        json={'query': {'query_image': {'blob': base64_image_string}}},
+        data=image_search_request_body,
+        headers={'content-type': 'application/json'},
     )
 
     assert response_raw.status_code == status.HTTP_200_OK
-    results = DocumentArray()
+    response_json = orjson.loads(response_raw.content)
+    assert len(response_json) == len(sample_search_response_text[0].matches)
+    # only the first match is checked, so only it is converted into a document
     # todo: use multimodal doc in the future
-    for response_json in response_raw.json():
-        content = list(response_json['fields'].values())[0]
-        doc = Document(
-            id=response_json['id'],
-            tags=response_json['tags'],
-            scores=response_json['scores'],
-            **content,
-        )
-        results.append(doc)
-    assert len(results) == len(sample_search_response_text[0].matches)
-    assert results[0].text == sample_search_response_text[0].matches[0].text
+    first_match = response_json[0]
+    content = list(first_match['fields'].values())[0]
+    doc = Document(
+        id=first_match['id'],
+        tags=first_match['tags'],
+        scores=first_match['scores'],
+        **content,
+    )
+    assert doc.text == sample_search_response_text[0].matches[0].text
+
+
+def test_batch_search_calls_flow_once(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+    base64_image_string: str,
+):
+    flow_response = DocumentArray([Document(), Document()])
+    flow_response[0].matches = DocumentArray([Document(text='match_0')])
+    flow_response[1].matches = DocumentArray(
+        [Document(text='match_1'), Document(text='match_2')]
+    )
+    response = client_with_mocked_jina_client(flow_response).post(
+        '/api/v1/search-app/batch_search',
+        json={
+            'queries': [
+                {'query_image': {'blob': base64_image_string}},
+                {'query_text': {'text': 'Hello'}},
+            ],
+            'limit': 5,
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()
+    assert len(results) == 2
+    assert [len(matches) for matches in results] == [1, 2]
+    assert results[1][1]['fields']['result_field']['text'] == 'match_2'
+    assert results[0][0]['tags']['url'] == '/search'
+    assert results[0][0]['tags']['parameters']['limit'] == 5
+
+
+def test_batch_search_rejects_too_many_queries(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+):
+    from deployment.bff.app.v1.models.search import MAX_BATCH_SEARCH_QUERIES
+
+    response = client_with_mocked_jina_client(DocumentArray()).post(
+        '/api/v1/search-app/batch_search',
+        json={
+            'queries': [
+                {'query_text': {'text': f'query {i}'}}
+                for i in range(MAX_BATCH_SEARCH_QUERIES + 1)
+            ],
+        },
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+def test_search_result_is_cached(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+    sample_search_response_text: DocumentArray,
+):
+    client = client_with_mocked_jina_client(sample_search_response_text)
+    request_body = {'query': {'query_text': {'text': 'Hello'}}}
+    first_response = client.post('/api/v1/search-app/search', json=request_body)
+    # the flow would return a different match now, but the cached result is used
+    sample_search_response_text[0].matches = DocumentArray([Document(text='other')])
+    second_response = client.post('/api/v1/search-app/search', json=request_body)
+
+    assert second_response.json() == first_response.json()
+    assert second_response.json()[0]['fields']['result_field']['text'] == 'match'
+
+
+def test_index_clears_cached_search_results(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+    sample_search_response_text: DocumentArray,
+    mocker: MockerFixture,
+):
+    import deployment.bff.app.v1.routers.search as bff_search
+
+    mocker.patch.object(
+        bff_search,
+        'fetch_user_input',
+        lambda data: UserInput(
+            search_fields_modalities={'title': Text}, search_fields=['title']
+        ),
+    )
+    client = client_with_mocked_jina_client(sample_search_response_text)
+    request_body = {'query': {'query_text': {'text': 'Hello'}}}
+    client.post('/api/v1/search-app/search', json=request_body)
+    client.post(
+        '/api/v1/search-app/index',
+        json={'data': [({'title': {'text': 'other'}}, {})]},
+    )
+    # the flow returns the newly indexed document now, the cache must not hide it
+    sample_search_response_text[0].matches = DocumentArray([Document(text='other')])
+    response = client.post('/api/v1/search-app/search', json=request_body)
+
+    assert response.json()[0]['fields']['result_field']['text'] == 'other'
+
+
+def test_batch_search_deduplicates_queries(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+):
+    # the flow only receives the two unique queries
+    flow_response = DocumentArray([Document(), Document()])
+    flow_response[0].matches = DocumentArray([Document(text='match_hello')])
+    flow_response[1].matches = DocumentArray([Document(text='match_world')])
+    response = client_with_mocked_jina_client(flow_response).post(
+        '/api/v1/search-app/batch_search',
+        json={
+            'queries': [
+                {'query_text': {'text': 'Hello'}},
+                {'query_text': {'text': 'World'}},
+                {'query_text': {'text': 'Hello'}},
+            ],
+        },
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    results = response.json()
+    assert [matches[0]['fields']['result_field']['text'] for matches in results] == [
+        'match_hello',
+        'match_world',
+        'match_hello',
+    ]
+
+
+def test_search_response_msgpack(
+    client_with_mocked_jina_client: Callable[[DocumentArray], requests.Session],
+):
+    flow_response = DocumentArray([Document()])
+    flow_response[0].matches = DocumentArray([Document(blob=b'\x00binary')])
+    response = client_with_mocked_jina_client(flow_response).post(
+        '/api/v1/search-app/search',
+        json={'query': {'query_text': {'text': 'Hello'}}},
+        headers={'Accept': 'application/msgpack'},
+    )
+
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers['content-type'] == 'application/msgpack'
+    results = msgpack.unpackb(response.content, raw=False)
+    assert results[0]['fields']['result_field']['blob'] == b'\x00binary'
+    assert results[0]['tags']['url'] == '/search'
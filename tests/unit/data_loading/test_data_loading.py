@@ -1,5 +1,7 @@
 """ This suite tests the data_loading.py module """
+import json
 import os
+from types import SimpleNamespace
 from typing import Tuple
 
 import pytest
@@ -9,12 +11,17 @@ from pytest_mock import MockerFixture
 
 from now.app.search_app import SearchApp
 from now.constants import DatasetTypes
+from now.data_loading import data_loading
 from now.data_loading.create_dataclass import (
     create_dataclass,
     create_dataclass_fields_file_mappings,
 )
 from now.data_loading.data_loading import (
+    _iter_folders_and_files,
     _list_files_from_s3_bucket,
+    _list_s3_keys,
+    _load_json_fields,
+    _pull_demo_dataset,
     from_files_local,
     load_data,
 )
@@ -118,6 +125,53 @@ def test_da_custom_ds(da: DocumentArray):
         assert doc.chunks
 
 
+@pytest.fixture()
+def demo_dataset_cache(
+    tmpdir, monkeypatch, mocker: MockerFixture, da: DocumentArray
+) -> SimpleNamespace:
+    monkeypatch.setenv('NOW_PULL_CACHE', str(tmpdir))
+    monkeypatch.delenv('NOW_PULL_REFRESH', raising=False)
+    pull = mocker.patch.object(DocumentArray, 'pull', return_value=da)
+    return SimpleNamespace(path=str(tmpdir), pull=pull)
+
+
+def test_pull_demo_dataset_uses_cache(demo_dataset_cache, da: DocumentArray):
+    pulled_da = _pull_demo_dataset('demo')
+    cached_da = _pull_demo_dataset('demo')
+
+    assert demo_dataset_cache.pull.call_count == 1
+    assert os.listdir(demo_dataset_cache.path) == ['demo.bin']
+    assert is_da_text_equal(pulled_da, da)
+    assert is_da_text_equal(cached_da, da)
+
+
+@pytest.mark.parametrize(
+    'refresh, num_pulls', [('1', 2), ('true', 2), ('0', 1), ('false', 1)]
+)
+def test_pull_demo_dataset_refresh(
+    demo_dataset_cache, monkeypatch, refresh: str, num_pulls: int
+):
+    _pull_demo_dataset('demo')
+    monkeypatch.setenv('NOW_PULL_REFRESH', refresh)
+    _pull_demo_dataset('demo')
+
+    assert demo_dataset_cache.pull.call_count == num_pulls
+
+
+def test_pull_demo_dataset_evicts_least_recently_used(demo_dataset_cache, monkeypatch):
+    monkeypatch.setattr(data_loading, 'DEMO_DATASET_CACHE_SIZE', 2)
+    _pull_demo_dataset('first')
+    _pull_demo_dataset('second')
+    # make the order of use independent of the resolution of the file timestamps
+    os.utime(os.path.join(demo_dataset_cache.path, 'first.bin'), (1, 1))
+    os.utime(os.path.join(demo_dataset_cache.path, 'second.bin'), (2, 2))
+    _pull_demo_dataset('first')
+    _pull_demo_dataset('third')
+
+    assert demo_dataset_cache.pull.call_count == 3
+    assert sorted(os.listdir(demo_dataset_cache.path)) == ['first.bin', 'third.bin']
+
+
 def test_from_files_local(resources_folder_path):
     user_input = UserInput()
     user_input.dataset_type = DatasetTypes.PATH
@@ -141,6 +195,91 @@ def test_from_files_local(resources_folder_path):
         assert doc.chunks[0].uri
 
 
+def test_iter_folders_and_files_skips_hidden_files(gif_resource_path):
+    folders_and_files = sorted(_iter_folders_and_files(gif_resource_path))
+
+    assert len(folders_and_files) == 6
+    for folder, file_path in folders_and_files:
+        assert os.path.dirname(file_path) == folder
+        assert not os.path.basename(file_path).startswith('.')
+
+
+@pytest.mark.parametrize('use_simdjson', [True, False])
+def test_load_json_fields(tmpdir, monkeypatch, use_simdjson: bool):
+    if not use_simdjson:
+        monkeypatch.setattr(data_loading, 'simdjson', None)
+    content = {
+        'title': 'shoe',
+        'colors': ['red', {'shade': 'dark'}],
+        'meta': {'size': {'eu': 42}, 'stock': [1, 2]},
+        'ignored': 'value',
+    }
+    file_path = os.path.join(tmpdir, 'shoe.json')
+    other_file_path = os.path.join(tmpdir, 'other.json')
+    with open(file_path, 'w') as f:
+        json.dump(content, f)
+    with open(other_file_path, 'w') as f:
+        json.dump({'meta': {'size': {'eu': 38}}}, f)
+
+    data = _load_json_fields(file_path, ['title', 'colors', 'meta', 'missing'])
+    # the values must stay valid when the next file is parsed
+    _load_json_fields(other_file_path, ['meta'])
+
+    assert data == {
+        'title': 'shoe',
+        'colors': ['red', {'shade': 'dark'}],
+        'meta': {'size': {'eu': 42}, 'stock': [1, 2]},
+    }
+    assert type(data['colors']) is list
+    assert type(data['colors'][1]) is dict
+    assert type(data['meta']) is dict
+    assert type(data['meta']['stock']) is list
+
+
+def test_list_s3_keys_lists_sub_folders():
+    sub_folder_keys = {
+        'data/a/': ['data/a/image.png', 'data/a/test.txt'],
+        'data/b/': ['data/b/image.png'],
+    }
+    paginate_calls = []
+
+    def paginate(**kwargs):
+        paginate_calls.append(kwargs)
+        if kwargs.get('Delimiter') == '/':
+            return [
+                {
+                    'Contents': [{'Key': 'data/top.txt'}],
+                    'CommonPrefixes': [{'Prefix': 'data/a/'}],
+                },
+                {'CommonPrefixes': [{'Prefix': 'data/b/'}]},
+            ]
+        keys = sub_folder_keys[kwargs['Prefix']]
+        return [{'Contents': [{'Key': key} for key in keys]}]
+
+    paginator = SimpleNamespace(paginate=paginate)
+    client = SimpleNamespace(get_paginator=lambda operation_name: paginator)
+    bucket = SimpleNamespace(name='bucket', meta=SimpleNamespace(client=client))
+
+    keys = _list_s3_keys(bucket, 'data/')
+
+    assert sorted(keys) == [
+        'data/a/image.png',
+        'data/a/test.txt',
+        'data/b/image.png',
+        'data/top.txt',
+    ]
+    assert paginate_calls[0] == {
+        'Bucket': 'bucket',
+        'Prefix': 'data/',
+        'Delimiter': '/',
+    }
+    # the sub folders are listed without a delimiter
+    assert sorted(paginate_calls[1:], key=lambda call: call['Prefix']) == [
+        {'Bucket': 'bucket', 'Prefix': 'data/a/'},
+        {'Bucket': 'bucket', 'Prefix': 'data/b/'},
+    ]
+
+
 def test_from_subfolders_s3(get_aws_info):
     user_input = UserInput()
     (
@@ -0,0 +1,170 @@
+import json
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import pytest
+import requests
+from docarray import Document, DocumentArray
+
+import deployment.playground.src.search as playground_search
+
+URL_HOST = 'https://nowrun.jina.ai/api/v1/search-app/search'
+# attribute name, domain and endpoint of the calls
+CALL_FLOW_ARGS = ('image', 'https://nowrun.jina.ai', 'search')
+
+
+def _get_request_data(blob: str) -> dict:
+    return {
+        'host': 'grpcs://flow.wolf.jina.ai',
+        'limit': 9,
+        'filters': {},
+        'query': {'query_image': {'blob': blob}},
+    }
+
+
+def _call_flow_with_blob(blob: str) -> DocumentArray:
+    return playground_search.call_flow(
+        URL_HOST, _get_request_data(blob), *CALL_FLOW_ARGS
+    )
+
+
+def _get_json_response(content, status_code=200) -> SimpleNamespace:
+    body = json.dumps(content)
+    return SimpleNamespace(
+        status_code=status_code,
+        headers={'Content-Type': 'application/json'},
+        content=body.encode(),
+        text=body,
+        json=lambda: json.loads(body),
+    )
+
+
+def _get_match_json(_id: str, uri: str) -> dict:
+    return {
+        'id': _id,
+        'scores': {'cosine': {'value': 0.1}},
+        'tags': {},
+        'fields': {'result_field': {'uri': uri}},
+    }
+
+
+@pytest.fixture
+def mocked_bff(monkeypatch):
+    """Replaces the session state and answers the requests to the bff in order."""
+    session_state = SimpleNamespace(search_count=0, error_msg=None)
+    monkeypatch.setattr(
+        playground_search, 'st', SimpleNamespace(session_state=session_state)
+    )
+    monkeypatch.setattr(
+        playground_search,
+        'get_domain_and_request_data',
+        lambda jwt, top_k, filter_dict: ('https://nowrun.jina.ai', {'limit': 9}),
+    )
+    sent_requests, responses = [], []
+
+    def _request(self, method, url, **kwargs):
+        sent_requests.append((url, kwargs['json']))
+        return responses.pop(0)
+
+    monkeypatch.setattr(requests.Session, 'request', _request)
+    return SimpleNamespace(
+        session_state=session_state, requests=sent_requests, responses=responses
+    )
+
+
+@pytest.fixture
+def mocked_call_flow(monkeypatch):
+    """Replaces the request to the bff and records the data of each request."""
+    calls = []
+
+    def _call_flow(url_host, data, attribute_name, domain, endpoint):
+        calls.append(data)
+        return DocumentArray([Document(text=f'match {len(calls)}')])
+
+    monkeypatch.setattr(playground_search, '_call_flow', _call_flow)
+    monkeypatch.setattr(playground_search, '_call_flow_cache', OrderedDict())
+    return calls
+
+
+def test_search_batch_replaces_cloud_uris(mocked_bff):
+    mocked_bff.responses.append(
+        _get_json_response(
+            [
+                [_get_match_json('a', 's3://bucket/a.png')],
+                [_get_match_json('b', 'https://example.com/b.png')],
+            ]
+        )
+    )
+    temp_links = DocumentArray([Document(id='a', uri='https://bucket/a.png?sig')])
+    mocked_bff.responses.append(SimpleNamespace(content=temp_links.to_json()))
+
+    results = playground_search.search_batch('text', ['x', 'y', 'x'], jwt=None)
+
+    assert [docs[0].uri for docs in results] == [
+        'https://bucket/a.png?sig',
+        'https://example.com/b.png',
+        'https://bucket/a.png?sig',
+    ]
+    batch_url, batch_data = mocked_bff.requests[0]
+    assert batch_url.endswith('/batch_search')
+    assert len(batch_data['queries']) == 2
+    temp_link_url, temp_link_data = mocked_bff.requests[1]
+    assert temp_link_url.endswith('/temp_link')
+    assert temp_link_data == {'ids': ['a'], 'uris': ['s3://bucket/a.png']}
+    assert mocked_bff.session_state.error_msg is None
+
+
+def test_search_batch_sets_error_msg(mocked_bff):
+    mocked_bff.responses.append(
+        _get_json_response({'message': 'flow is down'}, status_code=500)
+    )
+
+    assert playground_search.search_batch('text', ['x'], jwt=None) is None
+    assert mocked_bff.session_state.error_msg == 'flow is down'
+
+
+def test_response_json_to_docs_converts_scores():
+    response_json = [
+        {
+            'id': 'match',
+            'scores': {'cosine': {'value': 0.3}},
+            'tags': {'color': 'red'},
+            'fields': {'result_field': {'text': 'hello'}},
+        }
+    ]
+
+    docs = playground_search.response_json_to_docs(response_json)
+
+    assert docs[0].scores['cosine'].value == 0.3
+    assert docs[0].tags == {'color': 'red'}
+    assert docs[0].text == 'hello'
+
+
+def test_call_flow_cache_key_depends_on_blob():
+    def _get_key(blob):
+        return playground_search._get_call_flow_cache_key(
+            URL_HOST, _get_request_data(blob), *CALL_FLOW_ARGS
+        )
+
+    assert _get_key('aGVsbG8=') == _get_key('aGVsbG8=')
+    assert _get_key('aGVsbG8=') != _get_key('aGVsbG9=')
+
+
+def test_call_flow_uses_cache(mocked_call_flow):
+    first = _call_flow_with_blob('YQ==')
+    second = _call_flow_with_blob('YQ==')
+    other = _call_flow_with_blob('Yg==')
+
+    assert len(mocked_call_flow) == 2
+    assert second is first
+    assert other[0].text == 'match 2'
+
+
+def test_call_flow_evicts_least_recently_used(mocked_call_flow, monkeypatch):
+    monkeypatch.setattr(playground_search, 'CALL_FLOW_CACHE_SIZE', 1)
+    _call_flow_with_blob('YQ==')
+    _call_flow_with_blob('Yg==')
+    _call_flow_with_blob('YQ==')
+
+    assert len(mocked_call_flow) == 3
+    assert len(playground_search._call_flow_cache) == 1
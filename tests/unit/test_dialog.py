@@ -36,7 +36,7 @@ class CmdPromptMock:
         return {question['name']: self._answers[question['name']]}
 
 
-MOCKED_DIALOGS_WITH_CONFIGS = [
+MOCKED_DIALOGS_WITH_CONFIGS = (
     (
         {
             'app': Apps.SEARCH_APP,
@@ -141,23 +141,26 @@ MOCKED_DIALOGS_WITH_CONFIGS = [
         },
         {'flow_name': 'testthisname'},
     ),
-]
+)
 
 
-@pytest.mark.parametrize(
-    ('mocked_user_answers', 'configure_kwargs'),
-    MOCKED_DIALOGS_WITH_CONFIGS,
+@pytest.fixture(
+    scope='module',
+    params=MOCKED_DIALOGS_WITH_CONFIGS,
+    ids=[f'case{i}' for i in range(len(MOCKED_DIALOGS_WITH_CONFIGS))],
 )
-def test_configure_user_input(
-    mocker: MockerFixture,
-    mocked_user_answers: Dict[str, str],
-    configure_kwargs: Dict,
-):
-    # expected user input
+def dialog_case(request):
+    """Returns the mocked answers, the configure kwargs and the expected user input."""
+    mocked_user_answers, configure_kwargs = request.param
     expected_user_input = UserInput()
     expected_user_input.__dict__.update(mocked_user_answers)
     expected_user_input.__dict__.update(configure_kwargs)
     expected_user_input.__dict__.pop('app')
+    return mocked_user_answers, configure_kwargs, expected_user_input
+
+
+def test_configure_user_input(mocker: MockerFixture, dialog_case):
+    mocked_user_answers, configure_kwargs, expected_user_input = dialog_case
 
     # mocked user input
     mocker.patch('now.utils.prompt', CmdPromptMock(mocked_user_answers))
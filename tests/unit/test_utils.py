@@ -1,4 +1,7 @@
-from now.utils import get_flow_id
+import hubble
+
+from now.now_dataclasses import UserInput
+from now.utils import clear_hubble_info_cache, get_flow_id, get_info_hubble
 
 
 def test_flow_id():
@@ -15,3 +18,28 @@ def test_flow_id():
         get_flow_id('grpcs://somethi.ng-test-nowapi-92625e8747.wolf.jina.ai')
         == 'somethi.ng-test-nowapi-92625e8747'
     )
+
+
+def test_get_info_hubble_is_cached(monkeypatch):
+    calls = []
+
+    class MockedClient:
+        token = 'token'
+
+        def __init__(self, *args, **kwargs):
+            pass
+
+        def get_user_info(self, *args, **kwargs):
+            calls.append(1)
+            return {'code': 200, 'data': {'email': 'abc.def@jina.ai'}}
+
+    monkeypatch.setattr(hubble, 'Client', MockedClient)
+    monkeypatch.setattr(hubble, 'get_token', lambda *args, **kwargs: 'token')
+    clear_hubble_info_cache()
+    for _ in range(2):
+        user_input = UserInput()
+        get_info_hubble(user_input)
+        assert user_input.admin_emails == ['abc.def@jina.ai']
+        assert user_input.jwt == {'token': 'token'}
+    assert len(calls) == 1
+    clear_hubble_info_cache()